@@ -1,6 +1,17 @@
 import numpy as np
 import pandas as pd
 from itertools import combinations
+from multiprocessing import shared_memory
+
+### Compact state layout used by to_bytes / from_bytes and the shared memory helpers:
+# 81 uint8 cell values (0 for empty), 81 little-endian uint16 candidate masks
+# (bit d set when digit d is a candidate) and one uint8 flag for vars["any_changes"].
+_GRID_DTYPE = np.dtype("u1")
+_MASK_DTYPE = np.dtype("<u2")
+_GRID_OFFSET = 0
+_MASK_OFFSET = _GRID_OFFSET + 81 * _GRID_DTYPE.itemsize
+_FLAG_OFFSET = _MASK_OFFSET + 81 * _MASK_DTYPE.itemsize
+STATE_SIZE = _FLAG_OFFSET + 1
 
 
 class SudokuGrid:
@@ -21,6 +32,95 @@ class SudokuGrid:
 
         self.updating_candidates()
 
+    @classmethod
+    def _state_views(cls, buffer):
+        # numpy views straight onto the buffer, so reading and writing do not copy it
+        grid_codes = np.ndarray(
+            (9, 9), dtype=_GRID_DTYPE, buffer=buffer, offset=_GRID_OFFSET
+        )
+        masks = np.ndarray(
+            (9, 9), dtype=_MASK_DTYPE, buffer=buffer, offset=_MASK_OFFSET
+        )
+        flag = np.ndarray((1,), dtype=np.uint8, buffer=buffer, offset=_FLAG_OFFSET)
+        return grid_codes, masks, flag
+
+    def write_state(self, buffer):
+        ### Write the compact state into a writable buffer of at least STATE_SIZE bytes
+        if len(memoryview(buffer).cast("B")) < STATE_SIZE:
+            raise ValueError(f"Buffer must hold at least {STATE_SIZE} bytes.")
+
+        grid_codes, masks, flag = self._state_views(buffer)
+        for i in range(9):
+            for j in range(9):
+                value = self.grid[i, j]
+                grid_codes[i, j] = int(value) if value != "" else 0
+
+                cell = self.candidates[i, j]
+                mask = 0
+                if isinstance(cell, set):
+                    for candidate in cell:
+                        mask |= 1 << int(candidate)
+                elif isinstance(cell, str) and cell != "":
+                    mask = 1 << int(cell)
+                masks[i, j] = mask
+
+        flag[0] = 1 if self.vars["any_changes"] else 0
+
+    def to_bytes(self):
+        buffer = bytearray(STATE_SIZE)
+        self.write_state(buffer)
+        return bytes(buffer)
+
+    @classmethod
+    def from_bytes(cls, data):
+        ### Rebuild a grid from its compact state without recomputing the candidates
+        if len(memoryview(data).cast("B")) < STATE_SIZE:
+            raise ValueError(f"Sudoku state must hold at least {STATE_SIZE} bytes.")
+
+        grid_codes, masks, flag = cls._state_views(data)
+        if grid_codes.max() > 9 or masks.max() >= 1 << 10 or (masks & 1).any():
+            raise ValueError(
+                "Invalid Sudoku state: cell values or candidates out of range."
+            )
+
+        self = cls.__new__(cls)
+        self.grid = np.where(grid_codes == 0, "", grid_codes.astype(str)).astype("<U1")
+        self.vars = {"any_changes": bool(flag[0])}
+        self.candidates = np.empty((9, 9), dtype=object)
+        for i in range(9):
+            for j in range(9):
+                if self.grid[i, j] != "":
+                    self.candidates[i, j] = self.grid[i, j]
+                else:
+                    mask = int(masks[i, j])
+                    self.candidates[i, j] = {
+                        str(d) for d in range(1, 10) if mask & (1 << d)
+                    }
+        return self
+
+    def to_shared_memory(self, name=None):
+        ### The caller owns the returned block and is responsible for close() and unlink()
+        shm = shared_memory.SharedMemory(name=name, create=True, size=STATE_SIZE)
+        try:
+            self.write_state(shm.buf)
+        except Exception:
+            shm.close()
+            shm.unlink()
+            raise
+        return shm
+
+    @classmethod
+    def from_shared_memory(cls, shm):
+        ### Accepts a SharedMemory block or the name of an existing one
+        if isinstance(shm, shared_memory.SharedMemory):
+            return cls.from_bytes(shm.buf)
+
+        block = shared_memory.SharedMemory(name=shm)
+        try:
+            return cls.from_bytes(block.buf)
+        finally:
+            block.close()
+
     def check_invalid(self):
         for i in range(9):
             for j in range(9):